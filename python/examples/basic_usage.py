@@ -72,4 +72,12 @@ if __name__ == "__main__":
         "  curl -X POST -H 'Content-Type: text/lino' -d '(dict obj_0)' http://localhost:8001/echo"
     )
 
-    uvicorn.run(api.get_fastapi_app(), host="0.0.0.0", port=8001)
+    # "auto" selects uvloop and httptools when the `server` extra is installed
+    uvicorn.run(
+        api.get_fastapi_app(),
+        host="0.0.0.0",
+        port=8001,
+        loop="auto",
+        http="auto",
+        access_log=False,
+    )
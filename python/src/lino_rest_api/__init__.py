@@ -8,7 +8,6 @@ requests and responses in Links Notation (LINO) format.
 from .app import LinoAPI
 from .middleware import (
     LINO_CONTENT_TYPE,
-    LinoRequest,
     LinoResponse,
     lino_request_handler,
 )
@@ -16,7 +15,6 @@ from .middleware import (
 __version__ = "0.1.0"
 __all__ = [
     "LinoAPI",
-    "LinoRequest",
     "LinoResponse",
     "lino_request_handler",
     "LINO_CONTENT_TYPE",
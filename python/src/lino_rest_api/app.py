@@ -5,40 +5,196 @@ Provides a convenient way to create FastAPI applications that
 communicate using Links Notation format by default.
 """
 
-from collections.abc import Callable
-from functools import wraps
+import asyncio
+import inspect
+import os
+from collections.abc import Callable, ValuesView
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, wraps
 from typing import Any
 
 from fastapi import FastAPI, Request
 from fastapi.routing import APIRoute
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
 
-from .middleware import LinoResponse, lino_request_handler
+from .middleware import (
+    LinoResponse,
+    decode_body,
+    lino_response_headers,
+    receive_body,
+    replay_body,
+    scope_content_type,
+)
+from .vendor import encode_bytes
 
+# Favors speed over ratio; LINO's repetitive tokens compress well at low levels
+GZIP_COMPRESS_LEVEL = 4
 
-class LinoAPIRoute(APIRoute):
+_ENCODE_POOL = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="lino-encode")
+
+
+def _is_large_payload(result: Any, min_items: int) -> bool:
+    """
+    Check whether a handler result is worth encoding off the event loop.
+
+    Counts top-level elements plus those of containers one level down, so
+    wrappers like {"items": [...], "count": n} are sized by their contents.
+
+    Args:
+        result: The handler result
+        min_items: Element count the result must exceed
+
+    Returns:
+        True if the result has more than min_items elements
+    """
+    if not isinstance(result, (list, dict, ValuesView)):
+        return False
+
+    size = len(result)
+    for value in result.values() if isinstance(result, dict) else result:
+        if size > min_items:
+            return True
+        if isinstance(value, (list, dict, ValuesView)):
+            size += len(value)
+    return size > min_items
+
+
+class LinoEndpoint:
+    """
+    Pure ASGI endpoint that calls a handler and sends its result as LINO.
+
+    Handler metadata is computed once at registration time, so serving a
+    request involves no reflection and no intermediate Response object.
+
+    When encode_in_thread_min_items is set, results with more elements are
+    encoded on a worker thread after the handler returns. Such results must
+    not be modified once returned, so handlers should return a snapshot
+    (e.g. list(store.values())) rather than live shared state.
+    """
+
+    def __init__(
+        self,
+        func: Callable,
+        status_code: int = 200,
+        encode_in_thread_min_items: int | None = None,
+    ):
+        """
+        Create an endpoint for a handler function.
+
+        Args:
+            func: The handler function
+            status_code: Status code for results that are not a Response
+            encode_in_thread_min_items: Element count above which results
+                are encoded on a worker thread, or None to always encode
+                on the event loop
+        """
+        params = inspect.signature(func).parameters
+        self.func = func
+        self.status_code = status_code
+        self.encode_in_thread_min_items = encode_in_thread_min_items
+        self.needs_request = "request" in params
+        self.needs_body = "body" in params
+        self.is_coroutine = inspect.iscoroutinefunction(func)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        kwargs = {}
+        if self.needs_body:
+            # Read straight from the ASGI channel rather than through Request.body()
+            raw_body = await receive_body(receive)
+            kwargs["body"] = decode_body(raw_body, scope_content_type(scope))
+            if self.needs_request:
+                receive = replay_body(raw_body, receive)
+        if self.needs_request:
+            kwargs["request"] = Request(scope, receive)
+
+        result = self.func(**kwargs)
+        if self.is_coroutine:
+            result = await result
+
+        # Handlers may return a ready-made response (e.g. LinoResponse with a status code)
+        if isinstance(result, Response):
+            await result(scope, receive, send)
+            return
+
+        if self.encode_in_thread_min_items is not None and _is_large_payload(
+            result, self.encode_in_thread_min_items
+        ):
+            loop = asyncio.get_running_loop()
+            body = await loop.run_in_executor(_ENCODE_POOL, encode_bytes, result)
+        else:
+            body = encode_bytes(result)
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": lino_response_headers(body),
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+# FastAPI route arguments that only take effect in FastAPI's own request
+# handling, which LINO routes bypass
+_UNSUPPORTED_ROUTE_ARGS = frozenset({"dependencies", "response_model", "response_class"})
+
+
+def _schema_endpoint(func: Callable) -> Callable:
     """
-    Custom APIRoute that automatically uses LINO for responses.
+    Build a parameterless stand-in for a handler, used only for OpenAPI.
+
+    The handler's `request` and `body` arguments are supplied by
+    LinoEndpoint, so they must not be documented as query parameters.
+
+    Args:
+        func: The handler function
+
+    Returns:
+        Function carrying the handler's name and docstring
     """
 
-    def get_route_handler(self) -> Callable:
-        original_handler = super().get_route_handler()
+    @wraps(func)
+    def endpoint() -> None:
+        return None
 
-        async def lino_handler(request: Request) -> LinoResponse:
-            response = await original_handler(request)
+    # wraps() exposes the handler's signature; FastAPI must see no parameters
+    endpoint.__signature__ = inspect.Signature()
+    return endpoint
 
-            # If it's already a LinoResponse, return as-is
-            if isinstance(response, LinoResponse):
-                return response
 
-            # If it's a regular Response, check if we should convert
-            if hasattr(response, "body"):
-                # Already has body, return as-is
-                return response
+class LinoAPIRoute(APIRoute):
+    """
+    APIRoute that is listed in the OpenAPI schema like any FastAPI route
+    but serves requests through a pure ASGI LinoEndpoint.
+    """
 
-            # Convert to LinoResponse
-            return LinoResponse(content=response)
+    def __init__(
+        self,
+        path: str,
+        endpoint: Callable,
+        encode_in_thread_min_items: int | None = None,
+        **kwargs,
+    ):
+        """
+        Create a route for a LINO handler.
 
-        return lino_handler
+        Args:
+            path: Route path
+            endpoint: The handler function
+            encode_in_thread_min_items: Passed to LinoEndpoint
+            **kwargs: FastAPI route arguments
+        """
+        super().__init__(path, _schema_endpoint(endpoint), **kwargs)
+        if self.dependencies:
+            raise TypeError("LINO routes do not support FastAPI dependencies")
+        # The OpenAPI data is computed by now; expose the real handler
+        self.endpoint = endpoint
+        self.app = LinoEndpoint(
+            endpoint,
+            status_code=self.status_code or 200,
+            encode_in_thread_min_items=encode_in_thread_min_items,
+        )
 
 
 class LinoAPI:
@@ -54,6 +210,8 @@ class LinoAPI:
         title: str = "LINO REST API",
         description: str = "REST API using Links Notation",
         version: str = "0.1.0",
+        gzip_minimum_size: int | None = 1024,
+        encode_in_thread_min_items: int | None = None,
         **kwargs,
     ):
         """
@@ -63,8 +221,14 @@ class LinoAPI:
             title: API title
             description: API description
             version: API version
+            gzip_minimum_size: Smallest response size in bytes to gzip for
+                clients that accept it, or None to disable compression
+            encode_in_thread_min_items: Encode results with more elements
+                than this on a worker thread so the event loop keeps serving
+                other requests; None (default) encodes on the event loop
             **kwargs: Additional FastAPI arguments
         """
+        self.encode_in_thread_min_items = encode_in_thread_min_items
         self.app = FastAPI(
             title=title,
             description=description,
@@ -72,6 +236,14 @@ class LinoAPI:
             **kwargs,
         )
 
+        # LINO text (type markers, base64 strings) compresses well
+        if gzip_minimum_size is not None:
+            self.app.add_middleware(
+                GZipMiddleware,
+                minimum_size=gzip_minimum_size,
+                compresslevel=GZIP_COMPRESS_LEVEL,
+            )
+
     def get(self, path: str, **kwargs):
         """
         Decorator for GET endpoints.
@@ -80,17 +252,7 @@ class LinoAPI:
             path: Route path
             **kwargs: Additional route arguments
         """
-
-        def decorator(func: Callable) -> Callable:
-            @wraps(func)
-            async def wrapper(request: Request) -> LinoResponse:
-                result = await self._call_handler(func, request)
-                return LinoResponse(content=result)
-
-            self.app.get(path, **kwargs)(wrapper)
-            return func
-
-        return decorator
+        return self._route(path, "GET", **kwargs)
 
     def post(self, path: str, **kwargs):
         """
@@ -100,17 +262,7 @@ class LinoAPI:
             path: Route path
             **kwargs: Additional route arguments
         """
-
-        def decorator(func: Callable) -> Callable:
-            @wraps(func)
-            async def wrapper(request: Request) -> LinoResponse:
-                result = await self._call_handler(func, request)
-                return LinoResponse(content=result)
-
-            self.app.post(path, **kwargs)(wrapper)
-            return func
-
-        return decorator
+        return self._route(path, "POST", **kwargs)
 
     def put(self, path: str, **kwargs):
         """
@@ -120,17 +272,7 @@ class LinoAPI:
             path: Route path
             **kwargs: Additional route arguments
         """
-
-        def decorator(func: Callable) -> Callable:
-            @wraps(func)
-            async def wrapper(request: Request) -> LinoResponse:
-                result = await self._call_handler(func, request)
-                return LinoResponse(content=result)
-
-            self.app.put(path, **kwargs)(wrapper)
-            return func
-
-        return decorator
+        return self._route(path, "PUT", **kwargs)
 
     def delete(self, path: str, **kwargs):
         """
@@ -140,17 +282,7 @@ class LinoAPI:
             path: Route path
             **kwargs: Additional route arguments
         """
-
-        def decorator(func: Callable) -> Callable:
-            @wraps(func)
-            async def wrapper(request: Request) -> LinoResponse:
-                result = await self._call_handler(func, request)
-                return LinoResponse(content=result)
-
-            self.app.delete(path, **kwargs)(wrapper)
-            return func
-
-        return decorator
+        return self._route(path, "DELETE", **kwargs)
 
     def patch(self, path: str, **kwargs):
         """
@@ -160,47 +292,38 @@ class LinoAPI:
             path: Route path
             **kwargs: Additional route arguments
         """
+        return self._route(path, "PATCH", **kwargs)
 
-        def decorator(func: Callable) -> Callable:
-            @wraps(func)
-            async def wrapper(request: Request) -> LinoResponse:
-                result = await self._call_handler(func, request)
-                return LinoResponse(content=result)
-
-            self.app.patch(path, **kwargs)(wrapper)
-            return func
-
-        return decorator
-
-    async def _call_handler(self, func: Callable, request: Request) -> Any:
+    def _route(self, path: str, method: str, **kwargs):
         """
-        Call a handler function with appropriate arguments.
+        Build a decorator that registers a handler as a LINO endpoint.
 
         Args:
-            func: The handler function
-            request: The FastAPI request
-
-        Returns:
-            Handler result
+            path: Route path
+            method: HTTP method
+            **kwargs: Additional route arguments
         """
-        import inspect
 
-        sig = inspect.signature(func)
-        params = sig.parameters
+        unsupported = sorted(_UNSUPPORTED_ROUTE_ARGS.intersection(kwargs))
+        if unsupported:
+            raise TypeError(f"LINO routes do not support: {', '.join(unsupported)}")
 
-        kwargs = {}
-
-        for name, _param in params.items():
-            if name == "request":
-                kwargs["request"] = request
-            elif name == "body":
-                kwargs["body"] = await lino_request_handler(request)
+        def decorator(func: Callable) -> Callable:
+            self.app.router.add_api_route(
+                path,
+                func,
+                methods=[method],
+                route_class_override=partial(
+                    LinoAPIRoute,
+                    encode_in_thread_min_items=self.encode_in_thread_min_items,
+                ),
+                # Documents responses as text/lino in the OpenAPI schema
+                response_class=LinoResponse,
+                **kwargs,
+            )
+            return func
 
-        # Check if the function is a coroutine
-        if inspect.iscoroutinefunction(func):
-            return await func(**kwargs)
-        else:
-            return func(**kwargs)
+        return decorator
 
     def get_fastapi_app(self) -> FastAPI:
         """
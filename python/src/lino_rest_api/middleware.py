@@ -5,60 +5,119 @@ Provides request body parsing and response formatting using LINO
 instead of JSON.
 """
 
+from collections.abc import Mapping
 from typing import Any
 
 from fastapi import Request
 from fastapi.responses import PlainTextResponse
+from starlette.background import BackgroundTask
+from starlette.requests import ClientDisconnect
+from starlette.types import Message, Receive, Scope
 
-from .vendor import decode, encode
+from .vendor import decode, encode_bytes
 
 # Content type for Links Notation format
 LINO_CONTENT_TYPE = "text/lino"
 
+# Raw ASGI content-type header sent with LINO responses
+LINO_CONTENT_TYPE_HEADER = (b"content-type", b"text/lino; charset=utf-8")
 
-class LinoRequest:
+# Encoded form of None, sent for empty responses without calling the encoder
+_NONE_ENCODED = b"(None)"
+
+
+def lino_response_headers(body: bytes) -> list[tuple[bytes, bytes]]:
     """
-    Wrapper for parsing LINO-formatted request bodies.
+    Build the raw ASGI headers for a LINO response body.
+
+    Args:
+        body: Encoded response body
+
+    Returns:
+        Content-type and content-length headers
     """
+    return [LINO_CONTENT_TYPE_HEADER, (b"content-length", str(len(body)).encode("latin-1"))]
 
-    def __init__(self, request: Request):
-        """
-        Initialize LinoRequest with a FastAPI request.
 
-        Args:
-            request: The FastAPI request object
-        """
-        self.request = request
-        self._body: Any | None = None
-        self._parsed = False
+def decode_body(raw_body: bytes, content_type: str) -> Any:
+    """
+    Decode a raw request body according to its content type.
 
-    async def body(self) -> Any:
-        """
-        Parse and return the request body as a Python object.
+    Args:
+        raw_body: The request body bytes
+        content_type: Value of the content-type header
 
-        Returns:
-            Decoded Python object from LINO body
-        """
-        if self._parsed:
-            return self._body
+    Returns:
+        Decoded Python object for LINO bodies, text otherwise
+    """
+    if LINO_CONTENT_TYPE in content_type:
+        body_str = raw_body.decode("utf-8")
+        return decode(body_str) if body_str.strip() else None
 
-        content_type = self.request.headers.get("content-type", "")
+    # Fall back to treating as plain text
+    return raw_body.decode("utf-8") if raw_body else None
 
-        if LINO_CONTENT_TYPE in content_type:
-            raw_body = await self.request.body()
-            body_str = raw_body.decode("utf-8")
 
-            if body_str.strip():
-                self._body = decode(body_str)
-            else:
-                self._body = None
-        else:
-            # Fall back to treating as plain text
-            raw_body = await self.request.body()
-            self._body = raw_body.decode("utf-8") if raw_body else None
+def scope_content_type(scope: Scope) -> str:
+    """
+    Get the content-type header straight from an ASGI scope.
 
-        self._parsed = True
-        return self._body
+    Args:
+        scope: The ASGI connection scope
+
+    Returns:
+        Content type, or an empty string if absent
+    """
+    for key, value in scope["headers"]:
+        if key == b"content-type":
+            return value.decode("latin-1")
+    return ""
+
+
+async def receive_body(receive: Receive) -> bytes:
+    """
+    Read the whole request body directly from the ASGI receive channel.
+
+    Args:
+        receive: The ASGI receive callable
+
+    Returns:
+        The request body bytes
+    """
+    body_parts = []
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            raise ClientDisconnect()
+        body_parts.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            return b"".join(body_parts)
+
+
+def replay_body(raw_body: bytes, receive: Receive) -> Receive:
+    """
+    Wrap a receive channel so an already-read body is delivered again.
+
+    Lets handlers that take both `body` and `request` still call
+    `request.body()` after the endpoint consumed the stream.
+
+    Args:
+        raw_body: The body previously read from `receive`
+        receive: The original ASGI receive callable
+
+    Returns:
+        A receive callable yielding `raw_body` first
+    """
+    pending = True
+
+    async def replay() -> Message:
+        nonlocal pending
+        if pending:
+            pending = False
+            return {"type": "http.request", "body": raw_body, "more_body": False}
+        return await receive()
+
+    return replay
 
 
 class LinoResponse(PlainTextResponse):
@@ -72,27 +131,56 @@ class LinoResponse(PlainTextResponse):
         self,
         content: Any = None,
         status_code: int = 200,
-        headers: dict | None = None,
-        **kwargs,
+        headers: Mapping[str, str] | None = None,
+        media_type: str | None = None,
+        background: BackgroundTask | None = None,
     ):
         """
         Create a LINO-formatted response.
 
+        The body is encoded straight to bytes and, unless custom headers or
+        a media type are given, the raw headers are built directly instead
+        of going through PlainTextResponse's header logic.
+
         Args:
             content: Python object to encode as LINO
             status_code: HTTP status code
             headers: Optional response headers
-            **kwargs: Additional arguments for PlainTextResponse
+            media_type: Optional media type overriding text/lino
+            background: Optional background task to run after sending
+        """
+        self.status_code = status_code
+        if media_type is not None:
+            self.media_type = media_type
+        self.background = background
+        self.body = _NONE_ENCODED if content is None else encode_bytes(content)
+
+        if headers is None and media_type is None:
+            self.raw_headers = lino_response_headers(self.body)
+        else:
+            self.init_headers(headers)
+
+    @classmethod
+    def from_encoded(cls, body: bytes, status_code: int = 200) -> "LinoResponse":
         """
-        # Encode the content as LINO
-        encoded_content = encode(content) if content is not None else encode(None)
+        Create a response from an already LINO-encoded body.
 
-        super().__init__(
-            content=encoded_content,
-            status_code=status_code,
-            headers=headers,
-            **kwargs,
-        )
+        Lets handlers reuse bodies that never change, such as error
+        messages, without running the encoder on every request.
+
+        Args:
+            body: LINO-encoded response body
+            status_code: HTTP status code
+
+        Returns:
+            LinoResponse sending `body` as-is
+        """
+        response = cls.__new__(cls)
+        response.status_code = status_code
+        response.background = None
+        response.body = body
+        response.raw_headers = lino_response_headers(body)
+        return response
 
 
 async def lino_request_handler(request: Request) -> Any:
@@ -107,5 +195,5 @@ async def lino_request_handler(request: Request) -> Any:
     Returns:
         Decoded Python object from the request body
     """
-    lino_request = LinoRequest(request)
-    return await lino_request.body()
+    content_type = request.headers.get("content-type", "")
+    return decode_body(await request.body(), content_type)
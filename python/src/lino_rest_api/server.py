@@ -5,17 +5,65 @@ This server provides a simple REST API using Links Notation
 instead of JSON for data exchange.
 """
 
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import Any
 
+from fastapi import FastAPI
+
 from .app import LinoAPI
 from .middleware import LinoResponse
+from .vendor import encode_bytes
+
+# How often the cached timestamp is refreshed, in seconds
+CLOCK_INTERVAL = 0.1
+
+# Current time in ISO format, refreshed in the background while the app runs
+# so handlers don't format a new timestamp on every request
+_cached_now_iso = datetime.now().isoformat()
+
+
+async def _refresh_clock() -> None:
+    """Keep the cached timestamp up to date."""
+    global _cached_now_iso
+
+    while True:
+        _cached_now_iso = datetime.now().isoformat()
+        await asyncio.sleep(CLOCK_INTERVAL)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Run the timestamp refresher for the lifetime of the app."""
+    task = asyncio.create_task(_refresh_clock())
+    try:
+        yield
+    finally:
+        task.cancel()
+
+
+# Response bodies that never change are encoded once at import
+_ITEM_NOT_FOUND_BODY = encode_bytes({"error": "Item not found"})
+# Health responses only differ in the timestamp, so the encoded body is
+# split around a placeholder and just the timestamp is encoded per request
+_HEALTH_PREFIX, _HEALTH_SUFFIX = encode_bytes({"status": "ok", "timestamp": None}).split(
+    encode_bytes(None)
+)
+
+
+def _item_not_found() -> LinoResponse:
+    """Build the 404 response for unknown item IDs."""
+    return LinoResponse.from_encoded(_ITEM_NOT_FOUND_BODY, status_code=404)
+
 
 # Create the LINO API
 api = LinoAPI(
     title="LINO REST API Demo",
     description="Example REST API using Links Notation instead of JSON",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # In-memory data store for demo
@@ -26,8 +74,9 @@ next_id = 1
 @api.get("/items")
 def list_items():
     """List all items."""
+    # The encoder walks the values view in place, without copying it to a list
     return {
-        "items": list(items.values()),
+        "items": items.values(),
         "count": len(items),
     }
 
@@ -39,7 +88,7 @@ async def get_item(request):
     item = items.get(item_id)
 
     if not item:
-        return LinoResponse(content={"error": "Item not found"}, status_code=404)
+        return _item_not_found()
 
     return item
 
@@ -55,7 +104,7 @@ async def create_item(body):
     item = {
         "id": item_id,
         **(body or {}),
-        "created_at": datetime.now().isoformat(),
+        "created_at": _cached_now_iso,
     }
 
     items[item_id] = item
@@ -69,12 +118,12 @@ async def update_item(request, body):
     item_id = int(request.path_params.get("item_id"))
 
     if item_id not in items:
-        return LinoResponse(content={"error": "Item not found"}, status_code=404)
+        return _item_not_found()
 
     item = {
         "id": item_id,
         **(body or {}),
-        "updated_at": datetime.now().isoformat(),
+        "updated_at": _cached_now_iso,
     }
 
     items[item_id] = item
@@ -88,7 +137,7 @@ async def delete_item(request):
     item_id = int(request.path_params.get("item_id"))
 
     if item_id not in items:
-        return LinoResponse(content={"error": "Item not found"}, status_code=404)
+        return _item_not_found()
 
     del items[item_id]
 
@@ -98,10 +147,9 @@ async def delete_item(request):
 @api.get("/health")
 def health_check():
     """Health check endpoint."""
-    return {
-        "status": "ok",
-        "timestamp": datetime.now().isoformat(),
-    }
+    return LinoResponse.from_encoded(
+        _HEALTH_PREFIX + encode_bytes(_cached_now_iso) + _HEALTH_SUFFIX
+    )
 
 
 # Get the FastAPI app for uvicorn
@@ -113,4 +161,5 @@ if __name__ == "__main__":
 
     print("Starting LINO REST API server...")
     print("Try: curl -H 'Content-Type: text/lino' http://localhost:8000/health")
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # "auto" selects uvloop and httptools when the `server` extra is installed
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="auto", http="auto", access_log=False)
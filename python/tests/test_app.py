@@ -1,8 +1,15 @@
 """Tests for LinoAPI."""
 
+import inspect
+import threading
+
 import pytest
+from fastapi.testclient import TestClient
 
+from lino_rest_api import app as app_module
 from lino_rest_api.app import LinoAPI
+from lino_rest_api.middleware import LINO_CONTENT_TYPE, LinoResponse
+from lino_rest_api.vendor import decode, encode
 
 
 def test_create_lino_api():
@@ -52,3 +59,262 @@ def test_lino_api_register_get_endpoint():
     routes = [route.path for route in fastapi_app.routes if hasattr(route, "path")]
 
     assert "/test" in routes
+
+
+def test_lino_api_get_endpoint_returns_lino():
+    """Test GET endpoint responds with LINO-encoded body."""
+    api = LinoAPI()
+
+    @api.get("/test")
+    def test_endpoint():
+        return {"status": "ok"}
+
+    client = TestClient(api.get_fastapi_app())
+    response = client.get("/test")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith(LINO_CONTENT_TYPE)
+    assert decode(response.text) == {"status": "ok"}
+
+
+def test_lino_api_post_endpoint_receives_body():
+    """Test POST endpoint receives decoded LINO body and path params."""
+    api = LinoAPI()
+
+    @api.post("/echo/{name}")
+    async def echo(request, body):
+        return {"name": request.path_params["name"], "body": body}
+
+    client = TestClient(api.get_fastapi_app())
+    response = client.post(
+        "/echo/alice",
+        content=encode({"value": 42}),
+        headers={"content-type": LINO_CONTENT_TYPE},
+    )
+
+    assert decode(response.text) == {"name": "alice", "body": {"value": 42}}
+
+
+def test_lino_api_endpoint_returns_lino_response():
+    """Test handlers can return LinoResponse with a custom status code."""
+    api = LinoAPI()
+
+    @api.get("/missing")
+    def missing():
+        return LinoResponse(content={"error": "not found"}, status_code=404)
+
+    client = TestClient(api.get_fastapi_app())
+    response = client.get("/missing")
+
+    assert response.status_code == 404
+    assert decode(response.text) == {"error": "not found"}
+
+
+def test_lino_api_body_still_readable_from_request():
+    """Test handlers taking body and request can still read the raw body."""
+    api = LinoAPI()
+
+    @api.put("/raw")
+    async def raw(request, body):
+        return {"body": body, "raw": (await request.body()).decode("utf-8")}
+
+    client = TestClient(api.get_fastapi_app())
+    response = client.put("/raw", content="plain text", headers={"content-type": "text/plain"})
+
+    assert decode(response.text) == {"body": "plain text", "raw": "plain text"}
+
+
+def test_lino_api_inspects_handler_only_at_registration(monkeypatch):
+    """Test handler signatures are not inspected while serving requests."""
+    api = LinoAPI()
+
+    @api.post("/echo")
+    async def echo(request, body):
+        return body
+
+    signature = inspect.signature
+    iscoroutinefunction = inspect.iscoroutinefunction
+
+    def no_signature(obj, *args, **kwargs):
+        assert obj is not echo, "handler signature inspected per request"
+        return signature(obj, *args, **kwargs)
+
+    def no_iscoroutinefunction(obj):
+        assert obj is not echo, "handler inspected per request"
+        return iscoroutinefunction(obj)
+
+    monkeypatch.setattr(inspect, "signature", no_signature)
+    monkeypatch.setattr(inspect, "iscoroutinefunction", no_iscoroutinefunction)
+
+    client = TestClient(api.get_fastapi_app())
+    response = client.post(
+        "/echo", content=encode([1, 2]), headers={"content-type": LINO_CONTENT_TYPE}
+    )
+
+    assert decode(response.text) == [1, 2]
+
+
+def test_lino_api_gzips_large_responses():
+    """Test large responses are gzipped for clients that accept it."""
+    api = LinoAPI()
+
+    @api.get("/large")
+    def large():
+        return {"items": [f"item {i}" for i in range(200)]}
+
+    @api.get("/small")
+    def small():
+        return {"status": "ok"}
+
+    client = TestClient(api.get_fastapi_app())
+    large_response = client.get("/large", headers={"accept-encoding": "gzip"})
+    small_response = client.get("/small", headers={"accept-encoding": "gzip"})
+
+    assert large_response.headers["content-encoding"] == "gzip"
+    assert decode(large_response.text) == {"items": [f"item {i}" for i in range(200)]}
+    assert "content-encoding" not in small_response.headers
+
+
+def test_lino_api_gzip_can_be_disabled():
+    """Test compression is skipped when gzip_minimum_size is None."""
+    api = LinoAPI(gzip_minimum_size=None)
+
+    @api.get("/large")
+    def large():
+        return {"items": [f"item {i}" for i in range(200)]}
+
+    client = TestClient(api.get_fastapi_app())
+    response = client.get("/large", headers={"accept-encoding": "gzip"})
+
+    assert "content-encoding" not in response.headers
+
+
+def test_lino_api_encodes_large_results_on_worker_thread(monkeypatch):
+    """Test large results are encoded off the event loop thread when enabled."""
+    api = LinoAPI(encode_in_thread_min_items=64)
+    threads = []
+    encode_bytes = app_module.encode_bytes
+
+    def recording_encode_bytes(obj):
+        threads.append(threading.current_thread().name)
+        return encode_bytes(obj)
+
+    monkeypatch.setattr(app_module, "encode_bytes", recording_encode_bytes)
+
+    @api.get("/large")
+    def large():
+        return {"items": list(range(100)), "count": 100}
+
+    @api.get("/values")
+    def values():
+        return {i: i for i in range(100)}.values()
+
+    @api.get("/small")
+    def small():
+        return {"items": [1, 2, 3]}
+
+    client = TestClient(api.get_fastapi_app())
+
+    assert decode(client.get("/large").text) == {"items": list(range(100)), "count": 100}
+    assert decode(client.get("/values").text) == list(range(100))
+    assert decode(client.get("/small").text) == {"items": [1, 2, 3]}
+    assert threads[0].startswith("lino-encode")
+    assert threads[1].startswith("lino-encode")
+    assert not threads[2].startswith("lino-encode")
+
+
+def test_lino_api_encodes_on_event_loop_by_default(monkeypatch):
+    """Test results are encoded on the event loop thread unless enabled."""
+    api = LinoAPI()
+    threads = []
+    encode_bytes = app_module.encode_bytes
+
+    def recording_encode_bytes(obj):
+        threads.append(threading.current_thread().name)
+        return encode_bytes(obj)
+
+    monkeypatch.setattr(app_module, "encode_bytes", recording_encode_bytes)
+
+    @api.get("/large")
+    def large():
+        return {"items": list(range(100))}
+
+    client = TestClient(api.get_fastapi_app())
+
+    assert decode(client.get("/large").text) == {"items": list(range(100))}
+    assert not threads[0].startswith("lino-encode")
+
+
+def test_lino_api_routes_accept_fastapi_route_arguments():
+    """Test route arguments like tags and status_code are honored."""
+    api = LinoAPI()
+
+    @api.post("/items", tags=["items"], status_code=201)
+    def create():
+        return {"created": True}
+
+    client = TestClient(api.get_fastapi_app())
+    response = client.post("/items")
+    operation = client.get("/openapi.json").json()["paths"]["/items"]["post"]
+
+    assert response.status_code == 201
+    assert decode(response.text) == {"created": True}
+    assert operation["tags"] == ["items"]
+    assert "201" in operation["responses"]
+
+
+def test_lino_api_routes_listed_in_openapi_schema():
+    """Test LINO routes are documented without handler-only parameters."""
+    api = LinoAPI()
+
+    @api.put("/items/{item_id}")
+    async def update_item(request, body):
+        """Update an item."""
+        return body
+
+    client = TestClient(api.get_fastapi_app())
+    operation = client.get("/openapi.json").json()["paths"]["/items/{item_id}"]["put"]
+
+    assert operation["description"] == "Update an item."
+    assert "parameters" not in operation
+    assert LINO_CONTENT_TYPE in operation["responses"]["200"]["content"]
+
+
+def test_lino_api_routes_expose_the_handler_as_endpoint():
+    """Test route.endpoint is the registered handler, not a schema stand-in."""
+    api = LinoAPI()
+
+    @api.get("/items")
+    def list_items():
+        return []
+
+    route = next(route for route in api.get_fastapi_app().routes if route.path == "/items")
+
+    assert route.endpoint is list_items
+
+
+def test_lino_api_reused_decorator_names_each_route_after_its_handler():
+    """Test a decorator applied twice does not reuse the first route name."""
+    api = LinoAPI()
+    decorator = api.get("/shared")
+
+    @decorator
+    def first():
+        return 1
+
+    @decorator
+    def second():
+        return 2
+
+    names = [route.name for route in api.get_fastapi_app().routes]
+
+    assert "first" in names
+    assert "second" in names
+
+
+def test_lino_api_rejects_unsupported_route_arguments():
+    """Test route arguments the LINO fast path cannot apply raise early."""
+    api = LinoAPI()
+
+    with pytest.raises(TypeError, match="dependencies"):
+        api.get("/test", dependencies=[])
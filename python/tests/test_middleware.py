@@ -1,11 +1,17 @@
 """Tests for LINO middleware."""
 
+import math
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
-from lino_rest_api.vendor import encode, decode
+from lino_rest_api.vendor import ObjectCodec, codec, encode, decode
+
+from starlette.requests import Request
 
 from lino_rest_api.middleware import (
     LinoResponse,
     LINO_CONTENT_TYPE,
+    lino_request_handler,
 )
 
 
@@ -55,6 +61,60 @@ def test_encode_decode_special_values():
     assert decoded == original
 
 
+def test_encode_decode_numbers():
+    """Test encode/decode roundtrip for numeric edge cases."""
+    original = [0, -7, 10**30, 0.1, -2.5e-8, 1e300, math.inf, -math.inf]
+    encoded = encode(original)
+
+    assert "(int 1000000000000000000000000000000)" in encoded
+    assert "(float -2.5e-08)" in encoded
+    assert decode(encoded) == original
+    assert math.isnan(decode(encode(math.nan)))
+
+
+def test_encode_decode_repeated_strings():
+    """Test encode/decode roundtrip when strings repeat across items."""
+    original = [{"name": "same", "tag": ""} for _ in range(3)]
+    encoded = encode(original)
+
+    assert encode(original) == encoded
+    assert decode(encoded) == original
+
+
+def test_decode_tolerates_surrounding_whitespace():
+    """Test decoding ignores leading and trailing whitespace."""
+    assert decode("  (int 42)\n") == 42
+
+
+def test_decode_general_links_notation():
+    """Test decoding notation outside the encoder's own output format."""
+    assert decode("(str 'aGk=')") == "hi"
+
+
+def test_decode_rejects_oversized_input():
+    """Test input over the parser's size limit is rejected, not fast-pathed."""
+    notation = "(list obj_0" + " (int 1)" * (codec._SIMPLE_MAX_INPUT_SIZE // 8) + ")"
+
+    with pytest.raises(ValueError, match="maximum allowed size"):
+        decode(notation)
+
+
+def test_decode_malformed_base64_like_stdlib():
+    """Test malformed base64 decodes as the stdlib does, with or without pybase64."""
+    assert decode("(str aGk=aGk=)") == "hi"
+    assert decode("(str aGk=a)") == "hi"
+    assert decode("(str aGk)") == "aGk"
+
+
+def test_encode_long_strings_are_not_cached():
+    """Test long strings round-trip without being kept in the string cache."""
+    long_value = "x" * (codec._STR_CACHE_MAX_LENGTH + 1)
+    before = codec._cached_str_fragment.cache_info().currsize
+
+    assert decode(encode(long_value)) == long_value
+    assert codec._cached_str_fragment.cache_info().currsize == before
+
+
 def test_lino_response_content_type():
     """Test LinoResponse uses correct content type."""
     response = LinoResponse(content={"test": "data"})
@@ -79,3 +139,138 @@ def test_lino_response_status_code():
     response = LinoResponse(content={"error": "not found"}, status_code=404)
 
     assert response.status_code == 404
+
+
+def test_lino_response_none_content():
+    """Test LinoResponse encodes missing content as None."""
+    response = LinoResponse()
+
+    assert decode(response.body.decode("utf-8")) is None
+    assert response.headers["content-length"] == str(len(response.body))
+
+
+def test_lino_response_custom_headers():
+    """Test LinoResponse keeps custom headers alongside LINO headers."""
+    response = LinoResponse(content={"a": 1}, headers={"x-custom": "yes"})
+
+    assert response.headers["x-custom"] == "yes"
+    assert response.headers["content-type"].startswith(LINO_CONTENT_TYPE)
+    assert response.headers["content-length"] == str(len(response.body))
+
+
+def test_decode_repeated_payload_returns_independent_objects():
+    """Test decoding the same payload twice does not share mutable results."""
+    encoded = encode({"items": [1, 2]})
+
+    first = decode(encoded)
+    first["items"].append(3)
+    second = decode(encoded)
+
+    assert second == {"items": [1, 2]}
+    assert second is not first
+
+
+def test_encode_subclasses_of_supported_types():
+    """Test subclasses of supported types encode like their base type."""
+
+    class Tags(list):
+        pass
+
+    class Name(str):
+        pass
+
+    original = {Name("tags"): Tags(["a", Name("b")])}
+    decoded = decode(encode(original))
+
+    assert decoded == {"tags": ["a", "b"]}
+    assert type(decoded["tags"]) is list
+
+
+def test_encode_float_subclass_with_custom_repr():
+    """Test float subclasses encode by value, not by their own repr."""
+
+    class Float64(float):
+        def __repr__(self):
+            return f"np.float64({float.__repr__(self)})"
+
+    encoded = encode([Float64(0.1)])
+
+    assert "np.float64" not in encoded
+    assert decode(encoded) == [0.1]
+
+
+def test_encode_dict_values_as_list():
+    """Test dict values views encode exactly like lists."""
+    store = {1: {"name": "a"}, 2: {"name": "b"}}
+
+    assert encode(store.values()) == encode(list(store.values()))
+    assert decode(encode({"items": store.values()})) == {"items": [{"name": "a"}, {"name": "b"}]}
+
+
+def test_encode_unsupported_type():
+    """Test encoding an unsupported type raises TypeError."""
+    with pytest.raises(TypeError):
+        encode({"value": object()})
+
+
+def test_codec_encodes_concurrently():
+    """Test a shared codec keeps no per-call state between overlapping encodes."""
+    codec = ObjectCodec()
+    payloads = [{"index": i, "items": [[i] * 50 for _ in range(20)]} for i in range(8)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        encoded = list(pool.map(codec.encode, payloads))
+
+    assert [decode(item) for item in encoded] == payloads
+
+
+def test_codec_decodes_general_notation_concurrently():
+    """Test overlapping decodes that need the full parser do not share its state."""
+    codec = ObjectCodec()
+    # Quoted ids fall outside the encoder's own format
+    notations = ["(list obj_0" + f" (str 'aGk=') (int {i})" * 500 + ")" for i in range(8)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        decoded = list(pool.map(codec.decode, notations))
+
+    assert decoded == [["hi", i] * 500 for i in range(8)]
+
+
+def test_encode_decode_circular_and_shared_references():
+    """Test cycles and shared objects are encoded as references."""
+    shared = [1, 2]
+    original = {"a": shared, "b": shared}
+    original["self"] = original
+
+    decoded = decode(encode(original))
+
+    assert decoded["a"] == [1, 2]
+    assert decoded["a"] is decoded["b"]
+    assert decoded["self"] is decoded
+
+
+def test_lino_response_from_encoded():
+    """Test LinoResponse can send a pre-encoded body as-is."""
+    body = encode({"error": "gone"}).encode("utf-8")
+    response = LinoResponse.from_encoded(body, status_code=410)
+
+    assert response.status_code == 410
+    assert response.body == body
+    assert response.headers["content-type"].startswith(LINO_CONTENT_TYPE)
+    assert response.headers["content-length"] == str(len(body))
+
+
+async def test_lino_request_handler_decodes_body():
+    """Test lino_request_handler decodes a LINO request body."""
+    body = encode({"name": "test"}).encode("utf-8")
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "headers": [(b"content-type", LINO_CONTENT_TYPE.encode("latin-1"))],
+    }
+
+    assert await lino_request_handler(Request(scope, receive)) == {"name": "test"}
@@ -0,0 +1,73 @@
+"""Tests for the example server."""
+
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from lino_rest_api import server
+from lino_rest_api.middleware import LINO_CONTENT_TYPE
+from lino_rest_api.vendor import decode, encode
+
+
+@pytest.fixture
+def client():
+    """Test client with the app lifespan running and an empty store."""
+    server.items.clear()
+    with TestClient(server.app) as test_client:
+        yield test_client
+    server.items.clear()
+
+
+def test_health_check(client):
+    """Test health endpoint reports ok with a timestamp."""
+    response = client.get("/health")
+    data = decode(response.text)
+
+    assert response.status_code == 200
+    assert data["status"] == "ok"
+    assert isinstance(data["timestamp"], str)
+
+
+def test_health_timestamp_is_refreshed(client):
+    """Test the cached timestamp advances while the app is running."""
+    first = decode(client.get("/health").text)["timestamp"]
+    time.sleep(server.CLOCK_INTERVAL * 3)
+    second = decode(client.get("/health").text)["timestamp"]
+
+    assert second > first
+
+
+def test_create_and_get_item(client):
+    """Test items can be created and fetched back."""
+    response = client.post(
+        "/items", content=encode({"name": "Widget"}), headers={"content-type": LINO_CONTENT_TYPE}
+    )
+    created = decode(response.text)["created"]
+
+    fetched = decode(client.get(f"/items/{created['id']}").text)
+
+    assert created["name"] == "Widget"
+    assert "created_at" in created
+    assert fetched == created
+
+
+def test_list_items(client):
+    """Test listing returns every item in creation order."""
+    for name in ("first", "second"):
+        client.post(
+            "/items", content=encode({"name": name}), headers={"content-type": LINO_CONTENT_TYPE}
+        )
+
+    data = decode(client.get("/items").text)
+
+    assert data["count"] == 2
+    assert [item["name"] for item in data["items"]] == ["first", "second"]
+
+
+def test_get_missing_item(client):
+    """Test fetching an unknown item returns 404."""
+    response = client.get("/items/999")
+
+    assert response.status_code == 404
+    assert decode(response.text) == {"error": "Item not found"}